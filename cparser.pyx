@@ -0,0 +1,46 @@
+# cython: language_level=3
+"""
+MircoParser 的 Cython 加速实现：按固定偏移解析数据体（body）
+
+- 编译：python setup.py build_ext --inplace
+- 未编译时 demo.py 自动回退到 numpy 实现（`MircoBodyArray`）
+- 返回 `models.MircoBodyRecord`，与 numpy 实现相同；方位角与两条曲线按 int8 解释
+"""
+
+from libc.stdint cimport int8_t
+
+from models import MircoBodyRecord
+
+cdef Py_ssize_t BODY_SIZE = 46
+cdef Py_ssize_t CURVE_LEN = 20
+
+
+cdef list _curve(const unsigned char[::1] chunk, Py_ssize_t start):
+    cdef Py_ssize_t i
+    return [<int8_t>chunk[start + i] for i in range(CURVE_LEN)]
+
+
+cpdef list parse_bodies(const unsigned char[::1] data, Py_ssize_t n):
+    """从连续的 n 个 body 字节中解析出 MircoBodyRecord 列表"""
+    cdef list bodies = []
+    cdef const unsigned char[::1] chunk
+    cdef Py_ssize_t i, offset
+
+    if data.shape[0] < n * BODY_SIZE:
+        raise ValueError(f"需要 {n * BODY_SIZE} 字节，实际 {data.shape[0]} 字节")
+
+    for i in range(n):
+        offset = i * BODY_SIZE
+        chunk = data[offset:offset + BODY_SIZE]
+        bodies.append(MircoBodyRecord(
+            chunk[0] if chunk[0] != 0 else 1,
+            chunk[1],
+            <int8_t>chunk[2],
+            chunk[3],
+            chunk[4],
+            chunk[5],
+            # 两条曲线沿用原切片 [-44:-24] / [-24:-4]
+            _curve(chunk, BODY_SIZE - 44),
+            _curve(chunk, BODY_SIZE - 24),
+        ))
+    return bodies
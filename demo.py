@@ -22,64 +22,120 @@ OOP 串口读取示例
 备注：如果协议细节（如 CRC 算法或字段长度）与实际设备不同，请根据设备文档调整 `MircoParser` 中的偏移和大小。
 """
 
+import csv
+import logging
+import struct
 import time
 import json
 import serial
 import serial.tools.list_ports
 import numpy as np
 from collections import deque
-from typing import Callable, List, Optional, cast, Literal as TyLiteral
+from collections.abc import Sequence
+from typing import Callable, List, Optional
 from threading import Thread, Lock, Event
 import queue
+from logging.handlers import QueueHandler, QueueListener
 from models import Serial as SerialConfig
-from models import MircoHead, MircoBody, MircoCheck, MircoData
+from models import MircoHead, MircoBodyRecord, MircoCheck, MircoData
 import tkinter as tk
 from tkinter import ttk
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import threading
 import queue
-from datetime import datetime, timedelta
 
+try:
+    from numba import njit
+except ImportError:  # 未安装 numba 时 scan_frames 改用 bytes.find 实现
+    njit = None
+
+try:
+    from cparser import parse_bodies
+except ImportError:  # 未编译 cparser.pyx 时数据体使用 numpy 解析
+    parse_bodies = None
+
+
+class MircoBodyArray(Sequence):
+    """数据体的惰性视图：底层为 `MircoParser.BODY_DTYPE` 结构化数组，按下标访问时才构造 MircoBodyRecord"""
+
+    def __init__(self, array: np.ndarray):
+        self.array = array
+
+    def __len__(self) -> int:
+        return len(self.array)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        rec = self.array[index]
+        tlv_signal = int(rec['tlv_signal'])
+        return MircoBodyRecord(
+            tlv_signal=1 if tlv_signal == 0 else tlv_signal,
+            target_distance=int(rec['target_distance']),
+            target_azimuth=int(rec['target_azimuth']),
+            current_status=int(rec['current_status']),
+            respiration_value=int(rec['respiration_value']),
+            heart_rate_value=int(rec['heart_rate_value']),
+            respiration_curve=rec['respiration_curve'].tolist(),
+            heart_rate_curve=rec['heart_rate_curve'].tolist(),
+        )
 
 
 class MircoParser:
     """解析器：从串口中查找帧起始符并解析完整帧为 Pydantic 模型"""
     START_SEQ = bytes([0x53, 0x59, 0x54, 0x43])
+    HEAD_SIZE = 8
+    # header（起始信号之后）：data_length, mode, time(分钟, 小端 u16), num_TLV, work_con, reserve
+    HEAD_STRUCT = struct.Struct('<BBHBBH')
     BODY_SIZE = 46
+    CHECK_SIZE = 4
+    # 单个 body 的字节布局；两条曲线沿用原切片 [-44:-24] / [-24:-4]，与前面的字段有重叠
+    BODY_DTYPE = np.dtype({
+        'names': ['tlv_signal', 'target_distance', 'target_azimuth', 'current_status',
+                  'respiration_value', 'heart_rate_value', 'respiration_curve', 'heart_rate_curve'],
+        'formats': ['u1', 'u1', 'i1', 'u1', 'u1', 'u1', ('i1', 20), ('i1', 20)],
+        'offsets': [0, 1, 2, 3, 4, 5, BODY_SIZE - 44, BODY_SIZE - 24],
+        'itemsize': BODY_SIZE,
+    })
 
     @staticmethod
-    def read_exact(ser: serial.Serial, size: int, timeout: Optional[float] = None) -> bytes:
-        """从串口读取精确的字节数，允许短读并在超时后返回已读数据"""
-        buf = bytearray()
-        start = time.time()
+    def read_exact(ser: serial.Serial, size: int) -> bytes:
+        """从串口读取精确的字节数，允许短读并在串口超时（ser.timeout）后返回已读数据"""
+        carry = getattr(ser, '_carry', b'')
+        buf = bytearray(carry[:size])
+        ser._carry = carry[size:]
         while len(buf) < size:
-            to_read = size - len(buf)
-            chunk = ser.read(to_read)
-            if chunk:
-                buf.extend(chunk)
-            else:
-                if timeout is not None and (time.time() - start) > timeout:
-                    break
-                time.sleep(0.01)
+            chunk = ser.read(size - len(buf))
+            if not chunk:
+                break
+            buf.extend(chunk)
         return bytes(buf)
 
     @classmethod
     def find_start(cls, ser: serial.Serial, timeout: float = 1.0) -> bool:
-        """在串口数据流中查找起始序列，找到返回 True，超时返回 False"""
-        window = bytearray()
+        """在串口数据流中查找起始序列，找到返回 True，超时返回 False
+
+        按批读取串口缓冲区中已有的全部字节并用 bytes.find 定位起始序列；
+        起始序列之后多读的字节暂存在 ser._carry 中，由 read_exact 优先消费。
+        """
+        tail = len(cls.START_SEQ) - 1
+        buf = bytearray(getattr(ser, '_carry', b''))
         start_time = time.time()
         while True:
-            b = ser.read(1)
-            if not b:
+            idx = buf.find(cls.START_SEQ)
+            if idx >= 0:
+                ser._carry = bytes(buf[idx + len(cls.START_SEQ):])
+                return True
+            # 只保留可能构成起始序列前缀的最后 3 个字节
+            del buf[:-tail]
+            chunk = ser.read(max(1, ser.in_waiting))
+            if not chunk:
                 if (time.time() - start_time) > timeout:
+                    ser._carry = bytes(buf)
                     return False
                 continue
-            window += b
-            if len(window) > len(cls.START_SEQ):
-                window.pop(0)
-            if bytes(window) == cls.START_SEQ:
-                return True
+            buf += chunk
 
     @classmethod
     def parse_frame_from_serial(cls, ser: serial.Serial, timeout: float = 1.0) -> Optional[MircoData]:
@@ -88,53 +144,26 @@ class MircoParser:
         if not found:
             return None
 
-        header_remain = cls.read_exact(ser, 1 + 1 + 2 + 1 + 1 + 2, timeout=timeout)
-        if len(header_remain) < 8:
+        header_remain = cls.read_exact(ser, cls.HEAD_SIZE)
+        if len(header_remain) < cls.HEAD_SIZE:
             return None
 
-        data_length = header_remain[0]
-        mode = header_remain[1]
-        time_field = list(header_remain[2:4])
-        num_TLV = header_remain[4]
-        work_con = header_remain[5]
-        reserve = list(header_remain[6:8])
+        data_length, mode, time_minutes, num_TLV, work_con, reserve_u16 = cls.HEAD_STRUCT.unpack_from(header_remain)
+        reserve = [reserve_u16 & 0xFF, reserve_u16 >> 8]
 
+        # header 之后的数据体与校验区一次读完
         expected_bodies_bytes = num_TLV * cls.BODY_SIZE
-        bodies_bytes = cls.read_exact(ser, expected_bodies_bytes, timeout=timeout)
-        if len(bodies_bytes) < expected_bodies_bytes:
+        rest = cls.read_exact(ser, expected_bodies_bytes + cls.CHECK_SIZE)
+        if len(rest) < expected_bodies_bytes + cls.CHECK_SIZE:
             return None
+        bodies_bytes = rest[:expected_bodies_bytes]
+        check_bytes = rest[expected_bodies_bytes:]
+
+        if parse_bodies is not None:
+            bodies = parse_bodies(bodies_bytes, num_TLV)
+        else:
+            bodies = MircoBodyArray(np.frombuffer(bodies_bytes, dtype=cls.BODY_DTYPE, count=num_TLV))
 
-        bodies: List[MircoBody] = []
-        offset = 0
-        for i in range(num_TLV):
-            chunk = bodies_bytes[offset: offset + cls.BODY_SIZE]
-            if len(chunk) < cls.BODY_SIZE:
-                return None
-            tlv_signal = chunk[0]
-            target_distance = chunk[1]
-            target_azimuth = chunk[2]
-            current_status = chunk[3]
-            respiration_value = chunk[4]
-            heart_rate_value = chunk[5]
-            respiration_curve = list(chunk[-44: -24])
-            heart_rate_curve = list(chunk[-24 : -4])
-
-            body = MircoBody(
-                tlv_signal=cast(TyLiteral[1, 2], 1 if tlv_signal == 0 else tlv_signal),
-                target_distance=target_distance,
-                target_azimuth=target_azimuth if target_azimuth <= 127 else target_azimuth - 256,
-                current_status=cast(TyLiteral[0x01, 0x02], current_status),
-                respiration_value=respiration_value,
-                heart_rate_value=heart_rate_value,
-                respiration_curve=respiration_curve,
-                heart_rate_curve=heart_rate_curve,
-            )
-            bodies.append(body)
-            offset += cls.BODY_SIZE
-
-        check_bytes = cls.read_exact(ser, 4, timeout=timeout)
-        if len(check_bytes) < 4:
-            return None
         crc = [check_bytes[0], check_bytes[1]]
         zw = [check_bytes[2], check_bytes[3]]
 
@@ -142,19 +171,20 @@ class MircoParser:
             start_signal=list(cls.START_SEQ),
             data_length=data_length,
             mode=mode,
-            time=time_field,
+            time=time_minutes,
             num_TLV=num_TLV,
             work_con=work_con,
             reserve=reserve,
         )
         check = MircoCheck(crc=crc, zw=zw)
-        data = MircoData(header=header, bodies=bodies, check=check)
+        # bodies 为 MircoBodyRecord 列表或惰性序列，跳过整帧校验；需要校验时对单个 body 调用 to_model()
+        data = MircoData.model_construct(header=header, bodies=bodies, check=check)
         
         # 返回数据和解析的头部信息
         return data, {
             'data_length': data_length,
             'mode': mode,
-            'time_minutes': time_field[0] + (time_field[1] << 8),  # 将2字节转换为分钟数
+            'time_minutes': time_minutes,
             'num_targets': num_TLV,
             'work_status': work_con,
             'reserve': reserve
@@ -164,14 +194,117 @@ class MircoParser:
 
 
 
+# 单次 scan_frames 调用最多切出的帧数，以及心率曲线在帧内的位置
+SCAN_BATCH = 64
+HR_CURVE_START = 41
+HR_CURVE_LEN = 20
+AVG_INDEX = 20
+# 串口接收缓冲区大小，以及每次从串口读取的最大字节数
+RX_BUFFER_SIZE = 8192
+READ_CHUNK = 1024
+# 帧的十六进制转储写入 frames.log，由 read_loop 中的 QueueListener 在后台线程落盘；
+# 将级别调到 INFO 及以上即可关闭转储（同时跳过十六进制格式化）
+frame_log = logging.getLogger('frames')
+frame_log.setLevel(logging.DEBUG)
+frame_log.propagate = False
+# 每攒够该帧数才写一次 data.csv / average1.csv
+CSV_FLUSH_FRAMES = 10
+# 一帧心率曲线中各点相对帧时间的偏移（秒，20Hz）
+SAMPLE_OFFSETS = np.arange(HR_CURVE_LEN) * 0.05
+
+
+def _scan_frames_kernel(buf, out_hr, out_avg, out_end):
+    """在 uint8 缓冲区中依次查找以 EE EE 结尾的帧
+
+    第 k 帧的结束位置写入 out_end[k]；帧长不少于 61 字节时，
+    心率曲线（索引41-60）写入 out_hr[k]，第21个字节写入 out_avg[k]，否则 out_avg[k] 置为 -1。
+    返回 (找到的帧数, 已消费的字节数)。
+    """
+    n = len(buf)
+    frames_found = 0
+    frame_start = 0
+    i = 0
+    while i + 1 < n and frames_found < len(out_end):
+        if buf[i] == 0xEE and buf[i + 1] == 0xEE:
+            frame_end = i + 2
+            out_end[frames_found] = frame_end
+            if frame_end - frame_start >= HR_CURVE_START + HR_CURVE_LEN:
+                for j in range(HR_CURVE_LEN):
+                    out_hr[frames_found, j] = buf[frame_start + HR_CURVE_START + j]
+                out_avg[frames_found] = buf[frame_start + AVG_INDEX]
+            else:
+                out_avg[frames_found] = -1
+            frames_found += 1
+            frame_start = frame_end
+            i = frame_end
+        else:
+            i += 1
+    return frames_found, frame_start
+
+
+def _scan_frames_find(buf, out_hr, out_avg, out_end):
+    """scan_frames 的纯 Python 版本：用 bytes.find 定位 EE EE，语义与 _scan_frames_kernel 相同"""
+    data = buf.tobytes()
+    frames_found = 0
+    frame_start = 0
+    while frames_found < len(out_end):
+        i = data.find(b'\xEE\xEE', frame_start)
+        if i < 0:
+            break
+        frame_end = i + 2
+        out_end[frames_found] = frame_end
+        if frame_end - frame_start >= HR_CURVE_START + HR_CURVE_LEN:
+            hr_start = frame_start + HR_CURVE_START
+            out_hr[frames_found] = buf[hr_start:hr_start + HR_CURVE_LEN]
+            out_avg[frames_found] = buf[frame_start + AVG_INDEX]
+        else:
+            out_avg[frames_found] = -1
+        frames_found += 1
+        frame_start = frame_end
+    return frames_found, frame_start
+
+
+scan_frames = njit(cache=True)(_scan_frames_kernel) if njit is not None else _scan_frames_find
+
+
+class RunningMean:
+    """定长滑动窗口的均值：追加/淘汰时增量维护窗口内的和，求均值为 O(1)"""
+
+    def __init__(self, size: int):
+        self.size = size
+        self._values = deque()
+        self._sum = 0
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def extend(self, values) -> None:
+        for value in values:
+            self._values.append(value)
+            self._sum += value
+            if len(self._values) > self.size:
+                self._sum -= self._values.popleft()
+
+    def mean(self) -> float:
+        return self._sum / len(self._values)
+
+
 class SerialReader:
     """面向对象的串口读取器"""
     def __init__(self, config: SerialConfig, line_mode: bool = True):
         self.config = config
         self.line_mode = line_mode
         self.ser: Optional[serial.Serial] = None
-        
-     
+        # CSV 文件在 open() 时打开一次，按帧攒行后批量写入；
+        # 串口线程写入、GUI 线程 close() 都会访问，统一由 _csv_lock 保护
+        self._csv_lock = threading.RLock()
+        self._hr_csv = None
+        self._avg_csv = None
+        self._hr_writer = None
+        self._avg_writer = None
+        self._pending_hr: List[tuple] = []
+        self._pending_avg: List[tuple] = []
+        self._pending_frames = 0
         
     @staticmethod
     def list_ports() -> List[str]:
@@ -202,18 +335,64 @@ class SerialReader:
         except Exception:
             stopbits = serial.STOPBITS_ONE
 
+        # 超时取单帧（单目标）传输时间的两倍，下限 50 ms；每字节按 10 bit（起始+8数据+停止）计
+        per_byte = 10 / self.config.baudrate
+        expected_frame_bytes = (len(MircoParser.START_SEQ) + MircoParser.HEAD_SIZE
+                                + MircoParser.BODY_SIZE + MircoParser.CHECK_SIZE)
+
         self.ser = serial.Serial(
             port=self.config.port,
             baudrate=self.config.baudrate,
-            timeout=1,
+            timeout=max(0.05, expected_frame_bytes * per_byte * 2),
             bytesize=bytesize,
             stopbits=stopbits,
         )
+        self._open_csv()
 
     def close(self) -> None:
         if self.ser and self.ser.is_open:
             self.ser.close()
             self.ser = None
+        self._close_csv()
+
+    def _open_csv(self) -> None:
+        with self._csv_lock:
+            if self._hr_csv is None:
+                self._hr_csv = open('data.csv', 'a', newline='')
+                self._hr_writer = csv.writer(self._hr_csv)
+            if self._avg_csv is None:
+                self._avg_csv = open('average1.csv', 'a', newline='')
+                self._avg_writer = csv.writer(self._avg_csv)
+
+    def _close_csv(self) -> None:
+        with self._csv_lock:
+            self._flush_csv()
+            for f in (self._hr_csv, self._avg_csv):
+                if f is not None:
+                    f.close()
+            self._hr_csv = self._avg_csv = None
+            self._hr_writer = self._avg_writer = None
+
+    def _write_csv(self, hr_data: bytes, avg: int) -> None:
+        """缓存一帧的 CSV 行，每 CSV_FLUSH_FRAMES 帧批量写入一次"""
+        with self._csv_lock:
+            self._pending_hr.extend((idx, f'{val:02X}') for idx, val in enumerate(hr_data, 1))
+            self._pending_avg.append((avg,))
+            self._pending_frames += 1
+            if self._pending_frames >= CSV_FLUSH_FRAMES:
+                self._flush_csv()
+
+    def _flush_csv(self) -> None:
+        with self._csv_lock:
+            if self._hr_writer is not None and self._pending_hr:
+                self._hr_writer.writerows(self._pending_hr)
+                self._hr_csv.flush()
+            if self._avg_writer is not None and self._pending_avg:
+                self._avg_writer.writerows(self._pending_avg)
+                self._avg_csv.flush()
+            self._pending_hr.clear()
+            self._pending_avg.clear()
+            self._pending_frames = 0
         
 
  
@@ -258,77 +437,73 @@ class SerialReader:
         # 在单独的线程中处理串口数据
         def serial_read_thread():
             try:
-                all_data = bytearray()
-                import csv
+                # 固定大小的接收缓冲区，串口数据直接读入其中；[read_pos, write_pos) 为尚未处理的数据
+                rx_buf = bytearray(RX_BUFFER_SIZE)
+                view = memoryview(rx_buf)
+                rx_arr = np.frombuffer(rx_buf, dtype=np.uint8)
+                read_pos = write_pos = 0
+                out_hr = np.zeros((SCAN_BATCH, HR_CURVE_LEN), dtype=np.uint8)
+                out_avg = np.zeros(SCAN_BATCH, dtype=np.int16)
+                out_end = np.zeros(SCAN_BATCH, dtype=np.int64)
                 
                 while True:
-                    data = self.ser.read(1024)
-                    if data:
-                        all_data.extend(data)
+                    # 剩余空间不足一次读取时，把未处理的数据移到缓冲区开头
+                    if RX_BUFFER_SIZE - write_pos < READ_CHUNK:
+                        pending = write_pos - read_pos
+                        if pending > RX_BUFFER_SIZE - READ_CHUNK:
+                            # 积压的数据中一直没有结束符，只保留最后一个字节（可能是半个 EE EE）
+                            read_pos = write_pos - 1
+                            pending = 1
+                        rx_arr[:pending] = rx_arr[read_pos:write_pos]
+                        read_pos, write_pos = 0, pending
+                    
+                    n = self.ser.readinto(view[write_pos:write_pos + READ_CHUNK])
+                    if n:
+                        write_pos += n
                         
-                        # 处理接收到的数据
+                        # 处理接收到的数据：逐批切出以 EE EE 结尾的帧
                         while True:
-                            # 查找 EE EE 的位置
-                            ee_found = False
+                            buf = rx_arr[read_pos:write_pos]
+                            frames_found, consumed = scan_frames(buf, out_hr, out_avg, out_end)
                             
-                            for i in range(len(all_data) - 1):
-                                if all_data[i] == 0xEE and all_data[i+1] == 0xEE:
-                                    # 提取帧
-                                    frame = all_data[:i+2]
-                                    
-                                    # 输出帧，每65个字节为一组
+                            dump_frames = frame_log.isEnabledFor(logging.DEBUG)
+                            frame_start = read_pos
+                            for k in range(frames_found):
+                                # 提取帧
+                                frame = view[frame_start:read_pos + out_end[k]]
+                                frame_start = read_pos + out_end[k]
+                                
+                                # 输出帧，每65个字节为一组
+                                if dump_frames:
                                     for j in range(0, len(frame), 65):
                                         chunk = frame[j:j+65]
-                                        hex_str = ' '.join(f'{byte_val:02X}' for byte_val in chunk)
-                                        print(hex_str)
-                                    
-                                    # 提取第42-61个字节作为心率曲线数据
-                                    if len(frame) >= 61:
-                                        # 获取第42-61个字节（索引41-60）
-                                        hr_data = frame[41:61]
-                                        
-                                        # 保存为CSV
-                                        timestamp = datetime.now().strftime("%H_%M_%S")
-                                        filename = "data.csv"
-                            
-                                        with open(filename, 'a', newline='') as f:
-                                            writer = csv.writer(f)
-                                            #writer.writerow(['Index', 'Hex_Value'])
-                                            for idx, val in enumerate(hr_data, 1):
-                                                hex_val = f'{val:02X}'
-                                                writer.writerow([idx, hex_val])
-                                        with open('average1.csv', 'a', newline='') as f:
-                                            writer = csv.writer(f)
-                                            writer.writerow([int(frame[20])])
-                                           
-                                        print(f"数据: {' '.join(f'{b:02X}' for b in hr_data)}")
-                                        print('\n')
-                                        
-                                        # 将数据放入队列
-                                        current_time = datetime.now()
-                                        for idx, val in enumerate(hr_data):
-                                            int_val = val
-                                            if int_val >= 128:
-                                                int_val = int_val - 256
-                                            point_time = current_time + timedelta(seconds=idx*0.05)
-                                            data_queue.put((int_val, point_time))
-                                    
-                                    # 移除已处理的帧
-                                    all_data = all_data[i+2:]
-                                    ee_found = True
-                                    break
+                                        frame_log.debug(chunk.hex(' ').upper())
+                                
+                                # 长度不足 61 字节的帧没有心率曲线
+                                if out_avg[k] < 0:
+                                    continue
+                                
+                                # 第42-61个字节（索引41-60）为心率曲线数据
+                                hr_data = bytes(out_hr[k])
+                                
+                                # 保存为CSV
+                                self._write_csv(hr_data, int(out_avg[k]))
+                                
+                                if dump_frames:
+                                    frame_log.debug(f"数据: {hr_data.hex(' ').upper()}")
+                                
+                                # 将数据放入队列：按 int8 重新解释字节，无需逐点做符号修正；每帧只入队一次
+                                data_queue.put((out_hr[k].view(np.int8).copy(), time.monotonic()))
+                                request_redraw()
                             
-                            if not ee_found:
+                            read_pos += consumed
+                            if frames_found < SCAN_BATCH:
                                 break
                                 
             except Exception as e:
                 print(f"Serial read error: {e}")
                 data_queue.put(('ERROR', None))
         
-        # 启动串口读取线程
-        serial_thread = threading.Thread(target=serial_read_thread, daemon=True)
-        serial_thread.start()
-        
         # 创建Tkinter窗口（在主线程中）
         root = tk.Tk()
         root.title("Heart Rate Monitor - Real Time")
@@ -336,17 +511,35 @@ class SerialReader:
         
         # 创建图表
         fig, ax = plt.subplots(figsize=(9, 4))
-        ax.set_title("Heart Rate - Real Time")
+        # 坐标轴标签与网格只设置一次；标题保留句柄，刷新时只改文字
+        title = ax.set_title("Heart Rate - Real Time")
         ax.set_xlabel("Time (seconds)")
         ax.set_ylabel("Heart Rate Value")
         ax.grid(True, alpha=0.3)
+        ax.set_xlim(0, 30)
         
-        # 初始化数据
-        heart_rate_data = []
-        times = []
+        # 曲线与标题为动画对象：完整重绘时不画，每次刷新时在缓存的背景上单独绘制（blit）
+        line, = ax.plot([], [], 'b-', linewidth=2, animated=True)
+        title.set_animated(True)
+        background = None
+        
+        # 初始化数据：只保留最近30秒的数据，超出部分由 deque 自动丢弃
+        max_points = 600  # 30秒 * 20Hz
+        heart_rate_data = deque(maxlen=max_points)
+        times = deque(maxlen=max_points)
+        avg_window = RunningMean(200)  # 10秒 * 20Hz
         
         # 将图表嵌入Tkinter
         canvas = FigureCanvasTkAgg(fig, master=root)
+        
+        def on_draw(event):
+            # 完整重绘（首次显示、窗口缩放、坐标范围变化）后重新缓存背景
+            nonlocal background
+            background = canvas.copy_from_bbox(fig.bbox)
+            ax.draw_artist(line)
+            ax.draw_artist(title)
+        
+        canvas.mpl_connect('draw_event', on_draw)
         canvas.draw()
         canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
@@ -371,65 +564,83 @@ class SerialReader:
         button_frame.pack(fill=tk.X, padx=10, pady=5)
         tk.Button(button_frame, text="Stop", command=stop_program, width=10).pack(side=tk.RIGHT)
         
+        # 有新数据时由串口线程请求重绘；redraw_pending 把尚未执行的多次请求合并为一次
+        redraw_pending = threading.Event()
+        
+        def request_redraw():
+            if not redraw_pending.is_set():
+                redraw_pending.set()
+                root.after(0, update_plot)
+        
         # 更新图表函数
         def update_plot():
+            redraw_pending.clear()
             try:
                 # 处理队列中的数据
                 new_data_count = 0
-                while not data_queue.empty():
-                    item = data_queue.get_nowait()
-                    if item == ('ERROR', None):
+                while True:
+                    try:
+                        item = data_queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    hr_values, frame_time = item
+                    if frame_time is None:
                         status_label.config(text="Serial Error", fg="red")
                         break
                     
-                    hr_value, point_time = item
-                    heart_rate_data.append(hr_value)
-                    times.append(point_time)
-                    new_data_count += 1
-                
-                # 只保留最近30秒的数据
-                max_points = 600  # 30秒 * 20Hz
-                if len(heart_rate_data) > max_points:
-                    heart_rate_data[:] = heart_rate_data[-max_points:]
-                    times[:] = times[-max_points:]
+                    # 每帧 20 个点，相邻点间隔 50 ms
+                    hr_list = hr_values.tolist()
+                    heart_rate_data.extend(hr_list)
+                    avg_window.extend(hr_list)
+                    times.extend((frame_time + SAMPLE_OFFSETS).tolist())
+                    new_data_count += len(hr_values)
                 
                 # 更新图表
                 if heart_rate_data:
-                    ax.clear()
+                    hr_arr = np.fromiter(heart_rate_data, dtype=np.int16, count=len(heart_rate_data))
                     
-                    # 计算相对时间
-                    if times:
-                        start_time = times[-1] - timedelta(seconds=min(30, len(heart_rate_data)/20))
-                        relative_times = [(t - start_time).total_seconds() 
-                                        for t in times[-len(heart_rate_data):]]
-                    else:
-                        relative_times = list(range(len(heart_rate_data)))
+                    # 计算相对时间（times 为 time.monotonic() 秒数，最后一个点对齐到窗口右端）
+                    times_arr = np.fromiter(times, dtype=np.float64, count=len(times))
+                    relative_times = times_arr - times_arr[-1] + min(30, len(heart_rate_data)/20)
                     
-                    # 绘制曲线
-                    ax.plot(relative_times, heart_rate_data, 'b-', linewidth=2)
-                    ax.set_title(f"Heart Rate - Real Time (Last {min(30, len(heart_rate_data)/20):.1f}s)")
-                    ax.set_xlabel("Time (seconds)")
-                    ax.set_ylabel("Heart Rate Value")
-                    ax.grid(True, alpha=0.3)
+                    # 更新曲线
+                    line.set_data(relative_times, hr_arr)
+                    title.set_text(f"Heart Rate - Real Time (Last {min(30, len(heart_rate_data)/20):.1f}s)")
                     
                     # 更新状态
                     if heart_rate_data:
                         current = heart_rate_data[-1]
-                        avg_10s = sum(heart_rate_data[-200:])/min(200, len(heart_rate_data))  # 10秒平均
+                        avg_10s = avg_window.mean()  # 10秒平均
                         status_label.config(text=f"Current: {current} | Avg (10s): {avg_10s:.1f}", fg="green")
                         points_label.config(text=str(len(heart_rate_data)))
                     
                     if new_data_count > 0:
-                        canvas.draw()
+                        lo, hi = int(hr_arr.min()), int(hr_arr.max())
+                        pad = max(1, (hi - lo) * 0.05)
+                        y_min, y_max = ax.get_ylim()
+                        out_of_range = lo < y_min or hi > y_max
+                        # 数据范围不足纵轴范围的一半（例如离群点已移出窗口）时同样收紧坐标轴
+                        too_loose = (hi - lo + 2 * pad) < (y_max - y_min) / 2
+                        if background is None or out_of_range or too_loose:
+                            # 按当前窗口数据重新计算纵轴范围并完整重绘一次（on_draw 会重新缓存背景）
+                            ax.set_ylim(lo - pad, hi + pad)
+                            canvas.draw()
+                        else:
+                            canvas.restore_region(background)
+                            ax.draw_artist(line)
+                            ax.draw_artist(title)
+                            canvas.blit(fig.bbox)
                 
             except Exception as e:
                 print(f"Update error: {e}")
-            
-            # 继续更新
-            root.after(100, update_plot)
+        
+        # 兜底心跳：没有新数据时也每 500 ms 处理一次队列（例如串口错误）
+        def heartbeat():
+            update_plot()
+            root.after(500, heartbeat)
         
         # 开始更新
-        update_plot()
+        heartbeat()
         
         # 窗口关闭处理
         def on_closing():
@@ -439,7 +650,20 @@ class SerialReader:
         
         root.protocol("WM_DELETE_WINDOW", on_closing)
         
+        # 帧转储经队列交给后台线程写入 frames.log，串口读取线程不做磁盘 I/O；
+        # 在窗口和图表创建完成后才启动，紧接 try/finally，保证异常时也能清理
+        log_queue = queue.Queue(-1)
+        log_handler = QueueHandler(log_queue)
+        log_file_handler = logging.FileHandler('frames.log', encoding='utf-8')
+        log_listener = QueueListener(log_queue, log_file_handler)
+        frame_log.addHandler(log_handler)
+        log_listener.start()
+        
         try:
+            # 启动串口读取线程（窗口与 update_plot 就绪后再启动，以便请求重绘）
+            serial_thread = threading.Thread(target=serial_read_thread, daemon=True)
+            serial_thread.start()
+            
             # 运行Tkinter主循环
             root.mainloop()
             
@@ -447,6 +671,9 @@ class SerialReader:
             print("\nUser interrupted, exiting.")
         finally:
             self.close()
+            log_listener.stop()
+            log_file_handler.close()
+            frame_log.removeHandler(log_handler)
             print("Serial port closed.")
 def main():
  
@@ -2,11 +2,14 @@
 mmWave 雷达协议数据模型（Pydantic）
 
 定义 SYTC 协议帧结构：MircoHead、MircoBody、MircoCheck、MircoData、Serial 配置。
+MircoBodyRecord 为解析热路径使用的无校验数据体（numpy 与 Cython 解析均返回该类型），
+需要校验时通过 MircoBodyRecord.to_model() 转换为 MircoBody。
 """
 
+from dataclasses import asdict, dataclass
 from typing import List, Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_serializer
 
 
 class MircoHead(BaseModel):
@@ -30,11 +33,10 @@ class MircoHead(BaseModel):
                     "0x03: 向前窄域, 0x04: 前向跟踪, 0x05: 双人监测"
     )
 
-    time: List[int] = Field(
-        default=[0x00, 0x00],
-        min_length=2,
-        max_length=2,
-        description="测量时间，固定2字节，单位为分钟"
+    time: int = Field(
+        default=0x0000,
+        ge=0x0000, le=0xFFFF,
+        description="测量时间，2字节（小端），单位为分钟"
     )
 
     num_TLV: int = Field(
@@ -91,6 +93,26 @@ class MircoBody(BaseModel):
     )
 
 
+@dataclass(frozen=True)
+class MircoBodyRecord:
+    """与 MircoBody 字段相同的轻量数据体，构造时不做校验"""
+    __slots__ = ('tlv_signal', 'target_distance', 'target_azimuth', 'current_status',
+                 'respiration_value', 'heart_rate_value', 'respiration_curve', 'heart_rate_curve')
+
+    tlv_signal: int
+    target_distance: int
+    target_azimuth: int
+    current_status: int
+    respiration_value: int
+    heart_rate_value: int
+    respiration_curve: List[int]
+    heart_rate_curve: List[int]
+
+    def to_model(self) -> MircoBody:
+        """转换为经过校验的 Pydantic 模型"""
+        return MircoBody.model_validate(asdict(self))
+
+
 class MircoCheck(BaseModel):
     crc: List[int] = Field(
         description="CRC16 何意味？",
@@ -114,6 +136,11 @@ class MircoData(BaseModel):
         description="数据校验和结束符"
     )
 
+    @field_serializer('bodies')
+    def _serialize_bodies(self, bodies) -> List[MircoBody]:
+        # 解析器以 model_construct 构造时 bodies 为未校验的惰性数据体，导出前逐个转换为 MircoBody
+        return [body.to_model() if isinstance(body, MircoBodyRecord) else body for body in bodies]
+
 
 class Serial(BaseModel):
     port: str = Field(
@@ -0,0 +1,14 @@
+"""
+编译可选的 Cython 加速模块（cparser.pyx）：
+
+    pip install cython
+    python setup.py build_ext --inplace
+"""
+
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    name="mmWave-radar",
+    ext_modules=cythonize("cparser.pyx", language_level=3),
+)